@@ -677,9 +677,7 @@ class FortranContainer(FortranBase):
         if type(self) is FortranSubmodule:
             self.permission = "private"
 
-        typestr = ""
-        for vtype in self.settings["extra_vartypes"]:
-            typestr = typestr + "|" + vtype
+        typestr = "".join(f"|{vtype}" for vtype in self.settings["extra_vartypes"])
         self.VARIABLE_RE = re.compile(
             self.VARIABLE_STRING.format(typestr), re.IGNORECASE
         )
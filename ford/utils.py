@@ -27,6 +27,7 @@ from __future__ import annotations
 import re
 import os.path
 import json
+import hashlib
 from ford.sourceform import (
     FortranBase,
     FortranType,
@@ -39,13 +40,14 @@ from ford.sourceform import (
     ExternalBoundProcedure,
 )
 
-from urllib.error import URLError
-from urllib.request import urlopen
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
 from urllib.parse import urljoin
 import pathlib
-from typing import Dict, Union, TYPE_CHECKING
-from io import StringIO
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union, TYPE_CHECKING
 import itertools
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 if TYPE_CHECKING:
     from ford.fortran_project import Project
@@ -57,6 +59,24 @@ LINK_RE = re.compile(r"\[\[(\w+(?:\.\w+)?)(?:\((\w+)\))?(?::(\w+)(?:\((\w+)\))?)
 # Each key of the form |name| will be replaced by the value found in the
 # dictionary in sub_macros.
 _MACRO_DICT: Dict[str, str] = {}
+# Pattern matching any of the macros, and the set of macros it was
+# built from, so it only needs rebuilding when a new one is registered
+_MACRO_RE: Optional[re.Pattern] = None
+_MACRO_RE_KEYS: Set[str] = set()
+
+# Parentheses and square brackets
+_BRACKET_RE = re.compile(r"[()\[\]]")
+# Characters which end the string returned by `get_parens`: letters,
+# underscores, colons, commas and spaces
+_PAREN_END_RE = re.compile(r"[^\W\d]|[:, ]")
+# Cache of patterns matching quoted strings or a given separator, used
+# by `quote_split`
+_QUOTE_SPLIT_RE: Dict[str, re.Pattern] = {}
+
+
+def _has_brackets(string: str) -> bool:
+    """Check if string contains any parentheses or square brackets"""
+    return "(" in string or ")" in string or "[" in string or "]" in string
 
 
 def get_parens(line: str, retlevel: int = 0, retblevel: int = 0) -> str:
@@ -67,28 +87,33 @@ def get_parens(line: str, retlevel: int = 0, retblevel: int = 0) -> str:
     """
     if not line:
         return line
-    parenstr = ""
+    if retlevel == 0 and retblevel == 0 and not _has_brackets(line):
+        end = _PAREN_END_RE.search(line)
+        return line[: end.start()] if end else line
     level = 0
     blevel = 0
-    for char in line:
+    # The result is always the start of the line, so we only need to
+    # find where it ends. Jump between brackets, and only search the
+    # characters in between for the end when at the requested levels
+    pos = 0
+    for bracket in _BRACKET_RE.finditer(line):
+        if level == retlevel and blevel == retblevel:
+            if end := _PAREN_END_RE.search(line, pos, bracket.start()):
+                return line[: end.start()]
+        char = bracket.group()
         if char == "(":
             level += 1
         elif char == ")":
             level -= 1
         elif char == "[":
             blevel += 1
-        elif char == "]":
+        else:
             blevel -= 1
-        elif (
-            (char.isalpha() or char in ("_", ":", ",", " "))
-            and level == retlevel
-            and blevel == retblevel
-        ):
-            return parenstr
-        parenstr = parenstr + char
+        pos = bracket.end()
 
     if level == retlevel and blevel == retblevel:
-        return parenstr
+        end = _PAREN_END_RE.search(line, pos)
+        return line[: end.start()] if end else line
     raise RuntimeError(f"Couldn't parse parentheses: {line}")
 
 
@@ -100,28 +125,30 @@ def strip_paren(line: str, retlevel: int = 0) -> list:
 
     e.g. strip_paren("foo(bar(quz) + faz) + baz(buz(cas))", 1) -> ["(bar() + faz)", "(buz())"]
     """
+    if "(" not in line and ")" not in line:
+        return [line] if line and retlevel == 0 else []
     retstrs = []
-    curstr = StringIO()
+    curstr = []
     level = 0
     for char in line:
         if char == "(":
             if level == retlevel or level + 1 == retlevel:
-                curstr.write(char)
+                curstr.append(char)
             level += 1
         elif char == ")":
             if level == retlevel or level - 1 == retlevel:
-                curstr.write(char)
+                curstr.append(char)
             if level == retlevel:
                 # We are leaving a scope of the desired level,
                 # and should split to indicate as such.
-                retstrs.append(curstr.getvalue())
-                curstr = StringIO()
+                retstrs.append("".join(curstr))
+                curstr = []
             level -= 1
         elif level == retlevel:
-            curstr.write(char)
+            curstr.append(char)
 
-    if curstr.getvalue() != "":
-        retstrs.append(curstr.getvalue())
+    if curstr:
+        retstrs.append("".join(curstr))
     return retstrs
 
 
@@ -131,22 +158,27 @@ def paren_split(sep, string):
     """
     if len(sep) != 1:
         raise ValueError("Separation string must be one character long")
+    if not _has_brackets(string):
+        return string.split(sep)
+    if sep in "()[]":
+        return [string]
+    # Split at every sep, and then only keep the splits where the
+    # brackets before it are balanced, so that all the per-character
+    # work is done by `str.split` and `str.count`
     retlist = []
     level = 0
     blevel = 0
     left = 0
-    for i in range(len(string)):
-        if string[i] == "(":
-            level += 1
-        elif string[i] == ")":
-            level -= 1
-        elif string[i] == "[":
-            blevel += 1
-        elif string[i] == "]":
-            blevel -= 1
-        elif string[i] == sep and level == 0 and blevel == 0:
-            retlist.append(string[left:i])
-            left = i + 1
+    right = 0
+    pieces = string.split(sep)
+    for piece in pieces[:-1]:
+        level += piece.count("(") - piece.count(")")
+        blevel += piece.count("[") - piece.count("]")
+        right += len(piece)
+        if level == 0 and blevel == 0:
+            retlist.append(string[left:right])
+            left = right + 1
+        right += 1
     retlist.append(string[left:])
     return retlist
 
@@ -157,34 +189,69 @@ def quote_split(sep, string):
     """
     if len(sep) != 1:
         raise ValueError("Separation string must be one character long")
+    try:
+        split_re = _QUOTE_SPLIT_RE[sep]
+    except KeyError:
+        # Match either a whole quoted string, including doubled quotes
+        # and unterminated strings, or the separator
+        split_re = _QUOTE_SPLIT_RE[sep] = re.compile(
+            rf"\"(?:\"\"|[^\"])*(?:\"|\Z)|'(?:''|[^'])*(?:'|\Z)|({re.escape(sep)})"
+        )
     retlist = []
-    squote = False
-    dquote = False
     left = 0
-    i = 0
-    while i < len(string):
-        if string[i] == '"' and not dquote:
-            if not squote:
-                squote = True
-            elif (i + 1) < len(string) and string[i + 1] == '"':
-                i += 1
-            else:
-                squote = False
-        elif string[i] == "'" and not squote:
-            if not dquote:
-                dquote = True
-            elif (i + 1) < len(string) and string[i + 1] == "'":
-                i += 1
-            else:
-                dquote = False
-        elif string[i] == sep and not dquote and not squote:
+    for match in split_re.finditer(string):
+        if match.group(1):
+            i = match.start()
             retlist.append(string[left:i])
             left = i + 1
-        i += 1
     retlist.append(string[left:])
     return retlist
 
 
+# Classifications that can be given in links, mapped to the project
+# list the linked entity is found in
+_LINK_TYPES = {
+    "module": "modules",
+    "extmodule": "extModules",
+    "type": "types",
+    "exttype": "extTypes",
+    "procedure": "procedures",
+    "extprocedure": "extProcedures",
+    "subroutine": "procedures",
+    "extsubroutine": "extProcedures",
+    "function": "procedures",
+    "extfunction": "extProcedures",
+    "proc": "procedures",
+    "extproc": "extProcedures",
+    "file": "allfiles",
+    "interface": "absinterfaces",
+    "extinterface": "extInterfaces",
+    "absinterface": "absinterfaces",
+    "extabsinterface": "extInterfaces",
+    "program": "programs",
+    "block": "blockdata",
+}
+
+# Classifications that can be given for sublinks, mapped to the
+# attribute of the parent entity the linked entity is found in
+_SUBLINK_TYPES = {
+    "variable": "variables",
+    "type": "types",
+    "constructor": "constructor",
+    "interface": "interfaces",
+    "absinterface": "absinterfaces",
+    "subroutine": "subroutines",
+    "function": "functions",
+    "final": "finalprocs",
+    "bound": "boundprocs",
+    "modproc": "modprocs",
+    "common": "common",
+}
+
+# All the project lists searched for links without a classification
+_LINK_CATEGORIES = tuple(dict.fromkeys(_LINK_TYPES.values()))
+
+
 def sub_links(string: str, project: Project) -> str:
     """
     Replace links to different parts of the program, formatted as
@@ -193,57 +260,68 @@ def sub_links(string: str, project: Project) -> str:
     [[parent-name:name]]. The object type can be placed in parentheses
     for either or both of these parts.
     """
-    LINK_TYPES = {
-        "module": "modules",
-        "extmodule": "extModules",
-        "type": "types",
-        "exttype": "extTypes",
-        "procedure": "procedures",
-        "extprocedure": "extProcedures",
-        "subroutine": "procedures",
-        "extsubroutine": "extProcedures",
-        "function": "procedures",
-        "extfunction": "extProcedures",
-        "proc": "procedures",
-        "extproc": "extProcedures",
-        "file": "allfiles",
-        "interface": "absinterfaces",
-        "extinterface": "extInterfaces",
-        "absinterface": "absinterfaces",
-        "extabsinterface": "extInterfaces",
-        "program": "programs",
-        "block": "blockdata",
-    }
-
-    SUBLINK_TYPES = {
-        "variable": "variables",
-        "type": "types",
-        "constructor": "constructor",
-        "interface": "interfaces",
-        "absinterface": "absinterfaces",
-        "subroutine": "subroutines",
-        "function": "functions",
-        "final": "finalprocs",
-        "bound": "boundprocs",
-        "modproc": "modprocs",
-        "common": "common",
-    }
+    # Most strings don't have any links, so avoid any more work for them
+    if "[[" not in string:
+        return string
+
+    # Lookup tables of entities by lowercase name, for each project
+    # list (or all of them for the key `None`). These are filled in
+    # lazily from an iterator over the lists, only as far as is needed
+    # to find the names looked up so far
+    indices: Dict[Optional[str], Tuple[Dict[str, FortranBase], Iterator]] = {}
+
+    def find_entity(name: str, category: Optional[str]) -> Optional[FortranBase]:
+        name = name.lower()
+        if category not in indices:
+            categories = (category,) if category else _LINK_CATEGORIES
+            indices[category] = (
+                {},
+                itertools.chain.from_iterable(
+                    getattr(project, val) for val in categories
+                ),
+            )
+        index, remaining = indices[category]
+        if name in index:
+            return index[name]
+        for obj in remaining:
+            # Keep the first match, in case of duplicated names
+            index.setdefault(obj.name.lower(), obj)
+            if name in index:
+                return index[name]
+        return None
+
+    # Tables of the children of entities, keyed by the `id` of the
+    # parent (which will outlive this call) and the child category
+    child_indices: Dict[Tuple[int, Optional[str]], Dict[str, FortranBase]] = {}
+
+    def find_child(
+        item: FortranBase, name: str, category: Optional[str]
+    ) -> Optional[FortranBase]:
+        key = (id(item), category)
+        if key not in child_indices:
+            index: Dict[str, FortranBase] = {}
+            for val in (category,) if category else _SUBLINK_TYPES.values():
+                if val == "constructor":
+                    constructor = getattr(item, "constructor", None)
+                    children = [constructor] if constructor else []
+                else:
+                    children = getattr(item, val, None) or []
+                for child in children:
+                    index.setdefault(child.name.lower(), child)
+            child_indices[key] = index
+        return child_indices[key].get(name.lower())
 
     def convert_link(match):
         ERR = "Warning: Could not substitute link {}. {}"
         url = ""
         name = ""
         found = False
-        searchlist = []
-        item = None
         # [name,obj,subname,subobj]
         if not match.group(2):
-            for key, val in LINK_TYPES.items():
-                searchlist.extend(getattr(project, val))
+            category = None
         else:
-            if match.group(2).lower() in LINK_TYPES:
-                searchlist.extend(getattr(project, LINK_TYPES[match.group(2).lower()]))
-            else:
+            category = _LINK_TYPES.get(match.group(2).lower())
+            if category is None:
                 print(
                     ERR.format(
                         match.group(), f'Unrecognized classification "{match.group(2)}"'
@@ -251,48 +329,22 @@ def sub_links(string: str, project: Project) -> str:
                 )
                 return match.group()
 
-        for obj in searchlist:
-            if match.group(1).lower() == obj.name.lower():
-                url = obj.get_url()
-                name = obj.name
-                found = True
-                item = obj
-                break
+        item = find_entity(match.group(1), category)
+        if item is not None:
+            url = item.get_url()
+            name = item.name
+            found = True
         else:
             print(ERR.format(match.group(), f'"{match.group(1)}" not found.'))
             url = ""
             name = match.group(1)
 
         if found and match.group(3):
-            searchlist = []
             if not match.group(4):
-                for key, val in SUBLINK_TYPES.items():
-                    if val == "constructor":
-                        if getattr(item, "constructor", False):
-                            searchlist.append(item.constructor)
-                        else:
-                            continue
-                    else:
-                        searchlist.extend(getattr(item, val, []))
+                subcategory = None
             else:
-                if match.group(4).lower() in SUBLINK_TYPES:
-                    if hasattr(item, SUBLINK_TYPES[match.group(4).lower()]):
-                        if match.group(4).lower() == "constructor":
-                            if item.constructor:
-                                searchlist.append(item.constructor)
-                        else:
-                            searchlist.extend(
-                                getattr(item, SUBLINK_TYPES[match.group(4).lower()])
-                            )
-                    else:
-                        print(
-                            ERR.format(
-                                match.group(),
-                                f'"{match.group(4)}" can not be contained in "{item.obj}"',
-                            )
-                        )
-                        return match.group()
-                else:
+                subcategory = _SUBLINK_TYPES.get(match.group(4).lower())
+                if subcategory is None:
                     print(
                         ERR.format(
                             match.group(),
@@ -300,13 +352,19 @@ def sub_links(string: str, project: Project) -> str:
                         )
                     )
                     return match.group()
+                if not hasattr(item, subcategory):
+                    print(
+                        ERR.format(
+                            match.group(),
+                            f'"{match.group(4)}" can not be contained in "{item.obj}"',
+                        )
+                    )
+                    return match.group()
 
-            for obj in searchlist:
-                if match.group(3).lower() == obj.name.lower():
-                    url = str(url) + "#" + obj.anchor
-                    name = obj.name
-                    item = obj
-                    break
+            child = find_child(item, match.group(3), subcategory)
+            if child is not None:
+                url = str(url) + "#" + child.anchor
+                name = child.name
             else:
                 print(
                     ERR.format(
@@ -320,8 +378,14 @@ def sub_links(string: str, project: Project) -> str:
         return f"<a>{name}</a>"
 
     # Get information from links (need to build an RE)
-    string = LINK_RE.sub(convert_link, string)
-    return string
+    result = []
+    pos = 0
+    for match in LINK_RE.finditer(string):
+        result.append(string[pos : match.start()])
+        result.append(convert_link(match))
+        pos = match.end()
+    result.append(string[pos:])
+    return "".join(result)
 
 
 def register_macro(string):
@@ -361,9 +425,15 @@ def sub_macros(string):
     Replaces macros in documentation with their appropriate values. These macros
     are used for things like providing URLs.
     """
-    for key, val in _MACRO_DICT.items():
-        string = string.replace(key, val)
-    return string
+    global _MACRO_RE, _MACRO_RE_KEYS
+
+    # All macros are delimited by `|`, so most strings can be skipped
+    if not _MACRO_DICT or "|" not in string:
+        return string
+    if _MACRO_DICT.keys() != _MACRO_RE_KEYS:
+        _MACRO_RE_KEYS = set(_MACRO_DICT)
+        _MACRO_RE = re.compile("|".join(re.escape(key) for key in _MACRO_DICT))
+    return _MACRO_RE.sub(lambda match: _MACRO_DICT[match.group()], string)
 
 
 def external(project, make=False, path="."):
@@ -389,6 +459,9 @@ def external(project, make=False, path="."):
         "generic",
     ]
 
+    # Sentinel for attributes an object doesn't have
+    _MISSING = object()
+
     # Mapping between entity name and its type
     ENTITIES = {
         "module": ExternalModule,
@@ -419,15 +492,16 @@ def external(project, make=False, path="."):
             else:
                 extDict["extends"] = intObj.extends
         for attrib in ATTRIBUTES:
-            if not hasattr(intObj, attrib):
+            attribute = getattr(intObj, attrib, _MISSING)
+            if attribute is _MISSING:
                 continue
 
-            attribute = getattr(intObj, attrib)
-
             if isinstance(attribute, list):
                 extDict[attrib] = [obj2dict(item) for item in attribute]
             elif isinstance(attribute, dict):
                 extDict[attrib] = {key: obj2dict(val) for key, val in attribute.items()}
+            elif isinstance(attribute, str):
+                extDict[attrib] = attribute
             else:
                 extDict[attrib] = str(attribute)
         return extDict
@@ -438,91 +512,185 @@ def external(project, make=False, path="."):
         local file system.
         """
 
-        return json.loads((url / "modules.json").read_text(encoding="utf-8"))
+        with open(url / "modules.json", encoding="utf-8") as f:
+            return json.load(f)
+
+    def modules_from_remote(url: str):
+        """
+        Get module information from an external project on the web,
+        reusing the cached copy from a previous run if it hasn't changed
+        """
+        modules_url = urljoin(url, "modules.json")
+        cache_dir = _external_cache_dir()
+        cache_name = hashlib.sha256(modules_url.encode("utf-8")).hexdigest()
+        cache_file = cache_dir / f"{cache_name}.json"
+        meta_file = cache_dir / f"{cache_name}.meta"
+
+        # Only ask for the server to tell us if the file is unchanged if
+        # we actually have a copy of it
+        headers = {}
+        try:
+            if cache_file.exists():
+                meta = json.loads(meta_file.read_text(encoding="utf-8"))
+                if meta.get("etag"):
+                    headers["If-None-Match"] = meta["etag"]
+                if meta.get("last_modified"):
+                    headers["If-Modified-Since"] = meta["last_modified"]
+        except (OSError, ValueError):
+            headers = {}
+
+        try:
+            response = urlopen(Request(modules_url, headers=headers))
+        except HTTPError as error:
+            if error.code != 304:
+                raise
+            with open(cache_file, "rb") as f:
+                return json.load(f)
+
+        data = response.read()
+        modules = json.loads(data)
+
+        meta = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        if meta["etag"] or meta["last_modified"]:
+            # Failing to cache isn't fatal, we'll just download it again
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                cache_file.write_bytes(data)
+                meta_file.write_text(json.dumps(meta), encoding="utf-8")
+            except OSError:
+                pass
+        return modules
 
     def dict2obj(extDict, url, parent=None, remote: bool = False) -> FortranBase:
         """
-        Converts a dictionary to an object and immediately adds it to the project
+        Converts a dictionary to an object and immediately adds it to the project,
+        along with all of its children
         """
-        name = extDict["name"]
-        if extDict["external_url"]:
-            extDict["external_url"] = extDict["external_url"].split("/", 1)[-1]
-            if remote:
-                external_url = urljoin(url, extDict["external_url"])
+        root = None
+        # New objects for each project list, added all at once at the end
+        buckets: Dict[str, List[FortranBase]] = defaultdict(list)
+        # Use an explicit stack rather than recursion to avoid the
+        # recursion limit for large projects. Each entry holds the
+        # dictionary to convert, its parent object, and the list or
+        # dict (and key) in the parent the new object belongs in
+        stack = [(extDict, parent, None, None)]
+        while stack:
+            extDict, parent, container, slot = stack.pop()
+            name = extDict["name"]
+            if extDict["external_url"]:
+                extDict["external_url"] = extDict["external_url"].split("/", 1)[-1]
+                if remote:
+                    external_url = urljoin(url, extDict["external_url"])
+                else:
+                    external_url = url / extDict["external_url"]
             else:
-                external_url = url / extDict["external_url"]
-        else:
-            external_url = extDict["external_url"]
-
-        # Look up what type of entity this is
-        obj_type = extDict.get("proctype", extDict["obj"]).lower()
-        # Construct the entity
-        extObj = ENTITIES[obj_type](name, external_url, parent)
-        # Now add it to the correct project list
-        project_list = getattr(project, extObj._project_list)
-        project_list.append(extObj)
-
-        if obj_type == "interface":
-            extObj.proctype = extDict["proctype"]
-        elif obj_type == "type":
-            extObj.extends = extDict["extends"]
-
-        for key in ATTRIBUTES:
-            if key not in extDict:
-                continue
-            if isinstance(extDict[key], list):
-                tmpLs = [
-                    dict2obj(item, url, extObj, remote) for item in extDict[key] if item
-                ]
-                setattr(extObj, key, tmpLs)
-            elif isinstance(extDict[key], dict):
-                tmpDict = {
-                    key2: dict2obj(item, url, extObj, remote)
-                    for key2, item in extDict[key].items()
-                    if item
-                }
-                setattr(extObj, key, tmpDict)
+                external_url = extDict["external_url"]
+
+            # Look up what type of entity this is
+            obj_type = extDict.get("proctype", extDict["obj"]).lower()
+            # Construct the entity
+            extObj = ENTITIES[obj_type](name, external_url, parent)
+            # Now add it to the correct project list
+            buckets[extObj._project_list].append(extObj)
+
+            if container is None:
+                root = extObj
+            elif slot is None:
+                container.append(extObj)
             else:
-                setattr(extObj, key, extDict[key])
-        return extObj
+                container[slot] = extObj
+
+            if obj_type == "interface":
+                extObj.proctype = extDict["proctype"]
+            elif obj_type == "type":
+                extObj.extends = extDict["extends"]
+
+            children = []
+            for key in ATTRIBUTES:
+                if key not in extDict:
+                    continue
+                if isinstance(extDict[key], list):
+                    tmpLs = []
+                    children.extend(
+                        (item, extObj, tmpLs, None) for item in extDict[key] if item
+                    )
+                    setattr(extObj, key, tmpLs)
+                elif isinstance(extDict[key], dict):
+                    tmpDict = {}
+                    children.extend(
+                        (item, extObj, tmpDict, key2)
+                        for key2, item in extDict[key].items()
+                        if item
+                    )
+                    setattr(extObj, key, tmpDict)
+                else:
+                    setattr(extObj, key, extDict[key])
+            # Push the children in reverse so that they're popped, and
+            # so added to the project, in their original order
+            stack.extend(reversed(children))
+
+        for project_list, objs in buckets.items():
+            getattr(project, project_list).extend(objs)
+        return root
 
     if make:
         # convert internal module object to a JSON database
         extModules = [obj2dict(module) for module in project.modules]
         (pathlib.Path(path) / "modules.json").write_text(json.dumps(extModules))
     else:
-        # get the external modules from the external URLs
+        # get the external modules from the external URLs. First
+        # register all the macros and work out where each project is
+        externals = []
         for urldef in project.external:
-            # get the external modules from the external URL
             url, short = register_macro(urldef)
-            remote = re.match("https?://", url)
-            try:
-                if remote:
-                    # Ensure the URL ends with '/' to have urljoin work as
-                    # intentend.
-                    if url[-1] != "/":
-                        url = url + "/"
-                    extModules = json.loads(
-                        urlopen(urljoin(url, "modules.json")).read().decode("utf8")
-                    )
-                else:
-                    url = pathlib.Path(url).resolve()
-                    extModules = modules_from_local(url)
-            except (URLError, json.JSONDecodeError) as error:
-                extModules = []
-                print(f"Could not open external URL '{url}', reason: {error}")
-            # convert modules defined in the JSON database to module objects
-            for extModule in extModules:
-                dict2obj(extModule, url, remote=remote)
+            remote = url.startswith(("http://", "https://"))
+            if remote:
+                # Ensure the URL ends with '/' to have urljoin work as
+                # intentend.
+                if url[-1] != "/":
+                    url = url + "/"
+            else:
+                url = pathlib.Path(url).resolve()
+            externals.append((url, remote))
+
+        # Fetching the external projects is mostly spent waiting on the
+        # network, so do it concurrently. The modules are still added to
+        # the project in the original order
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [
+                executor.submit(
+                    modules_from_remote if remote else modules_from_local, url
+                )
+                for url, remote in externals
+            ]
+            for (url, remote), future in zip(externals, futures):
+                try:
+                    extModules = future.result()
+                except (URLError, json.JSONDecodeError) as error:
+                    extModules = []
+                    print(f"Could not open external URL '{url}', reason: {error}")
+                # convert modules defined in the JSON database to module objects
+                for extModule in extModules:
+                    dict2obj(extModule, url, remote=remote)
+
+
+def _external_cache_dir() -> pathlib.Path:
+    """Directory to cache the modules of remote external projects in"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or "~/.cache"
+    return pathlib.Path(cache_home).expanduser() / "ford" / "external"
 
 
 def str_to_bool(text):
     """Convert string to bool. Only takes 'true'/'false', ignoring case"""
     if isinstance(text, bool):
         return text
-    if text.capitalize() == "True":
+    text_lower = text.lower()
+    if text_lower == "true":
         return True
-    if text.capitalize() == "False":
+    if text_lower == "false":
         return False
     raise ValueError(
         f"Could not convert string to bool: expected 'true'/'false', got '{text}'"
@@ -536,11 +704,22 @@ def normalise_path(
     return (base_dir / os.path.expandvars(path)).absolute()
 
 
-def traverse(root, attrs) -> list:
-    """Traverse a tree of objects, returning a list of all objects found
-    within the attributes attrs"""
-    nodes = []
-    for obj in itertools.chain(*[getattr(root, attr, []) for attr in attrs]):
-        nodes.append(obj)
-        nodes.extend(traverse(obj, attrs))
-    return nodes
+def traverse(root, attrs) -> Iterator:
+    """Traverse a tree of objects, yielding all objects found within the
+    attributes attrs, depth-first"""
+
+    def children(obj):
+        return itertools.chain.from_iterable(
+            getattr(obj, attr, None) or () for attr in attrs
+        )
+
+    # Use an explicit stack rather than recursion to avoid the function
+    # call overhead and recursion limit for deep trees
+    stack = [children(root)]
+    while stack:
+        for obj in stack[-1]:
+            yield obj
+            stack.append(children(obj))
+            break
+        else:
+            stack.pop()
@@ -1071,6 +1071,42 @@ def test_make_links(copy_fortran_file):
         assert link_locations == expected_links, (item, item.name)
 
 
+def test_make_links_with_classification(copy_fortran_file):
+    links = (
+        "[[ctype(type)]] [[cproc(proc)]] [[ctype(type):cvar(variable)]] "
+        "[[ctype:cproc(bound)]] [[ctype:x]]"
+    )
+
+    data = f"""\
+    module cmod !! {links}
+      type ctype
+        integer :: cvar
+      contains
+        procedure :: cproc
+      end type ctype
+    contains
+      subroutine cproc(self)
+        class(ctype) :: self
+      end subroutine cproc
+    end module cmod
+    """
+    settings = copy_fortran_file(data)
+    project = create_project(settings)
+
+    project.make_links()
+
+    docstring = BeautifulSoup(project.modules[0].doc, features="html.parser")
+    link_locations = [a.get("href", None) for a in docstring("a")]
+
+    assert link_locations == [
+        "../type/ctype.html",
+        "../proc/cproc.html",
+        "../type/ctype.html#variable-cvar",
+        "../type/ctype.html#boundprocedure-cproc",
+        "../type/ctype.html",
+    ]
+
+
 def test_submodule_procedure_issue_446(copy_fortran_file):
     data = """\
     module foo_mod
@@ -58,6 +58,8 @@ REMOTE_MODULES_JSON = [
 
 
 class MockResponse:
+    headers = {}
+
     @staticmethod
     def read():
         return json.dumps(REMOTE_MODULES_JSON).encode("utf-8")
@@ -114,6 +116,7 @@ def external_project(tmp_path_factory, monkeymodule, restore_macros_module):
         os.chdir(top_level_project)
         m.setattr(sys, "argv", ["ford", "doc.md"])
         m.setattr(ford.utils, "urlopen", mock_open)
+        m.setenv("XDG_CACHE_HOME", str(path / "cache"))
         ford.run()
 
     # Make sure we're in a directory where relative paths won't
@@ -1,3 +1,7 @@
+import json
+from types import SimpleNamespace
+from urllib.error import HTTPError, URLError
+
 import pytest
 
 import ford
@@ -17,6 +21,14 @@ def test_sub_macro_with_equals(restore_macros):
     assert result == "b=c"
 
 
+def test_sub_multiple_macros(restore_macros):
+    ford.utils.register_macro("a=b")
+    ford.utils.register_macro("c=d")
+    result = ford.utils.sub_macros("|a| |c| |a||e|")
+
+    assert result == "b d b|e|"
+
+
 def test_register_macro_clash(restore_macros):
     ford.utils.register_macro("a=b")
 
@@ -46,6 +58,8 @@ def test_str_to_bool_already_bool():
     ("string", "level", "expected"),
     [
         ("abcdefghi", 0, ["abcdefghi"]),
+        ("abcdefghi", 1, []),
+        ("", 0, []),
         ("abc(def)ghi", 1, ["(def)"]),
         ("abc(def)ghi", 0, ["abc()ghi"]),
         ("(abc)def(ghi)", 1, ["(abc)", "(ghi)"]),
@@ -54,3 +68,135 @@ def test_str_to_bool_already_bool():
 )
 def test_strip_paren(string, level, expected):
     assert ford.utils.strip_paren(string, retlevel=level) == expected
+
+
+@pytest.mark.parametrize(
+    ("string", "retlevel", "retblevel", "expected"),
+    [
+        ("", 0, 0, ""),
+        ("(a, b) :: c", 0, 0, "(a, b)"),
+        ("(a(b), [c, d]) e", 0, 0, "(a(b), [c, d])"),
+        ("(len=*), intent(in)", 0, 0, "(len=*)"),
+        ("c, name='foo') bar", -1, 0, "c, name='foo')"),
+        ("(1, 2)", 0, 0, "(1, 2)"),
+        ("*, intent(in)", 0, 0, "*"),
+        ("8", 0, 0, "8"),
+    ],
+)
+def test_get_parens(string, retlevel, retblevel, expected):
+    assert ford.utils.get_parens(string, retlevel, retblevel) == expected
+
+
+def test_get_parens_unbalanced():
+    with pytest.raises(RuntimeError):
+        ford.utils.get_parens("(a, (b)")
+
+
+@pytest.mark.parametrize(
+    ("sep", "string", "expected"),
+    [
+        (",", "", [""]),
+        (",", "a, b, c", ["a", " b", " c"]),
+        (",", "a(1, 2), b[3, 4], c", ["a(1, 2)", " b[3, 4]", " c"]),
+        ("=", "a(i=1) = b", ["a(i=1) ", " b"]),
+        (",", "a((1), [2, (3)]),", ["a((1), [2, (3)])", ""]),
+    ],
+)
+def test_paren_split(sep, string, expected):
+    assert ford.utils.paren_split(sep, string) == expected
+
+
+def test_traverse():
+    class Node:
+        def __init__(self, name, functions=None, subroutines=None):
+            self.name = name
+            self.functions = functions or []
+            self.subroutines = subroutines
+
+    root = Node(
+        "root",
+        functions=[Node("a", subroutines=[Node("b")]), Node("c")],
+        subroutines=[Node("d", functions=[Node("e")])],
+    )
+
+    result = ford.utils.traverse(root, ["functions", "subroutines"])
+    assert [node.name for node in result] == ["a", "b", "c", "d", "e"]
+
+
+@pytest.mark.parametrize(
+    ("string", "expected"),
+    [
+        ("", [""]),
+        ("a; b; c", ["a", " b", " c"]),
+        ("a = 'b; c'; d", ["a = 'b; c'", " d"]),
+        ('a = "b; c"; d', ['a = "b; c"', " d"]),
+        ("a = 'it''s; ok'; d", ["a = 'it''s; ok'", " d"]),
+        ("a = \"'\"; b = '\"'; c", ['a = "\'"', " b = '\"'", " c"]),
+        ("a = 'b; c", ["a = 'b; c"]),
+    ],
+)
+def test_quote_split(string, expected):
+    assert ford.utils.quote_split(";", string) == expected
+
+
+def test_external_remote_cache(monkeypatch, tmp_path, restore_macros):
+    modules = [{"name": "remote_module", "external_url": "", "obj": "module"}]
+    requests = []
+
+    class MockResponse:
+        headers = {"ETag": '"abc"'}
+
+        @staticmethod
+        def read():
+            return json.dumps(modules).encode("utf-8")
+
+    def mock_urlopen(request):
+        requests.append(request)
+        if request.get_header("If-none-match") == '"abc"':
+            raise HTTPError(request.full_url, 304, "Not Modified", {}, None)
+        return MockResponse()
+
+    monkeypatch.setattr(ford.utils, "urlopen", mock_urlopen)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    for _ in range(2):
+        project = SimpleNamespace(
+            external=["remote = https://example.com/doc"], extModules=[]
+        )
+        ford.utils.external(project)
+        assert [module.name for module in project.extModules] == ["remote_module"]
+
+    assert requests[0].get_header("If-none-match") is None
+    assert requests[1].get_header("If-none-match") == '"abc"'
+
+
+def test_external_multiple_remotes(monkeypatch, tmp_path, restore_macros, capsys):
+    class MockResponse:
+        headers = {}
+
+        def __init__(self, name):
+            self.name = name
+
+        def read(self):
+            module = {"name": self.name, "external_url": "", "obj": "module"}
+            return json.dumps([module]).encode("utf-8")
+
+    def mock_urlopen(request):
+        name = request.full_url.split("/")[2]
+        if name == "missing":
+            raise URLError("not found")
+        return MockResponse(name)
+
+    monkeypatch.setattr(ford.utils, "urlopen", mock_urlopen)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    project = SimpleNamespace(
+        external=[f"{name} = https://{name}/doc" for name in ["a", "missing", "b"]],
+        extModules=[],
+    )
+    ford.utils.external(project)
+
+    assert [module.name for module in project.extModules] == ["a", "b"]
+    assert (
+        "Could not open external URL 'https://missing/doc/'" in capsys.readouterr().out
+    )